@@ -1,27 +1,91 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import io
 import os
 import subprocess
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
 
 from . import prompts
 
 APP_DIR_NAME = ".multi_codex"
 MAX_FILE_SIZE_BYTES = 200 * 1024  # 200KB
-IGNORED_DIRS: Set[str] = {
-    ".git",
-    "node_modules",
-    "dist",
-    "build",
-    ".venv",
-    "venv",
-    "__pycache__",
-    ".idea",
-    ".vscode",
-    APP_DIR_NAME,
-}
+IGNORED_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "dist",
+        "build",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".idea",
+        ".vscode",
+        APP_DIR_NAME,
+    }
+)
+# Generated files that bloat prompts without adding comparison signal.
+IGNORED_FILES: frozenset[str] = frozenset(
+    {
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "Pipfile.lock",
+        "Cargo.lock",
+        "composer.lock",
+        "Gemfile.lock",
+        "uv.lock",
+        "go.sum",
+    }
+)
+IGNORED_FILE_SUFFIXES = (".min.js", ".min.css", ".map")
+# Extensions that are always binary; rejecting them by name skips the
+# read + NUL sniff the content check would need.
+BINARY_EXTENSIONS: frozenset[str] = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".bmp",
+        ".webp",
+        ".ico",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".xz",
+        ".7z",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".eot",
+        ".mp3",
+        ".mp4",
+        ".mov",
+        ".avi",
+        ".exe",
+        ".dll",
+        ".so",
+        ".dylib",
+        ".jar",
+        ".class",
+        ".pyc",
+        ".wasm",
+    }
+)
 LANGUAGE_EXTENSIONS = {
     ".py": "python",
     ".js": "javascript",
@@ -80,6 +144,70 @@ def run_git(repo_path: str | Path, args: List[str]) -> str:
     return result.stdout.strip()
 
 
+async def run_git_async(repo_path: str | Path, args: List[str]) -> str:
+    """Async variant of :func:`run_git` built on asyncio subprocess support.
+
+    Lets event-loop callers (the monitor loop, concurrent snapshot stages)
+    overlap git work without tying up a worker thread per call.
+    """
+
+    cmd = ["git", "-C", str(repo_path)] + args
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+    return stdout.decode("utf-8", errors="replace").strip()
+
+
+_LAST_FETCH_TS: Dict[str, float] = {}
+# The debounce is check-then-act; without the lock a background prefetch
+# and a foreground call would both spawn git fetch on the same clone and
+# can collide on ref locks.
+_FETCH_LOCK = threading.Lock()
+
+
+def fetch_if_stale(repo_path: str | Path, max_age: float = 25.0) -> bool:
+    """Fetch origin unless this repo was fetched within the last max_age seconds.
+
+    The monitor loop, branch collection, and diff computation all want
+    fresh refs but frequently run back to back; debouncing keeps that to
+    one network round-trip. Concurrent callers serialize on a lock, so
+    the second one waits and then lands on the debounce instead of
+    racing a second fetch. Returns True when a fetch actually ran.
+    """
+
+    key = str(repo_path)
+    with _FETCH_LOCK:
+        now = time.monotonic()
+        last = _LAST_FETCH_TS.get(key)
+        if last is not None and now - last < max_age:
+            return False
+
+        run_git(repo_path, ["fetch", "origin", "--prune", "--no-tags"])
+        _LAST_FETCH_TS[key] = time.monotonic()
+        return True
+
+
+def fetch_now(repo_path: str | Path) -> None:
+    """Fetch origin immediately, bypassing the debounce but not the lock.
+
+    For callers that already know the remote moved (e.g. the monitor's
+    ls-remote digest changed) and must see the new refs locally; a
+    debounced no-op there would leave the change invisible. Refreshes
+    the debounce timestamp so follow-up fetch_if_stale calls coalesce.
+    """
+
+    key = str(repo_path)
+    with _FETCH_LOCK:
+        run_git(repo_path, ["fetch", "origin", "--prune", "--no-tags"])
+        _LAST_FETCH_TS[key] = time.monotonic()
+
+
+@lru_cache(maxsize=None)
 def slugify_repo_url(url: str) -> str:
     """Convert a GitHub repository URL into a filesystem-friendly slug."""
     url = url.strip()
@@ -89,8 +217,6 @@ def slugify_repo_url(url: str) -> str:
     if url.startswith("git@"):
         path_part = url.split(":", 1)[1].strip("/")
     else:
-        from urllib.parse import urlparse
-
         parsed = urlparse(url)
         path_part = (parsed.path or "").lstrip("/")
 
@@ -123,35 +249,39 @@ def is_binary_content(sample: bytes) -> bool:
 
 
 def read_text_file(path: Path) -> Optional[str]:
-    """Read a file as text, skipping binary and very large files."""
+    """Read a file as text, skipping binary and very large files.
 
-    try:
-        size = path.stat().st_size
-        if size > MAX_FILE_SIZE_BYTES:
-            return None
+    A single binary read covers the size check, the binary sniff, and the
+    decode — the previous stat + sniff-open + text-open touched each file
+    three times.
+    """
 
+    try:
         with path.open("rb") as f:
-            sample = f.read(4096)
-            if is_binary_content(sample):
-                return None
-
-        with path.open("r", encoding="utf-8") as f:
-            return f.read()
-    except UnicodeDecodeError:
-        try:
-            with path.open("r", encoding="latin-1") as f:
-                return f.read()
-        except Exception:
-            return None
+            data = f.read(MAX_FILE_SIZE_BYTES + 1)
     except Exception:
         return None
 
+    if len(data) > MAX_FILE_SIZE_BYTES:
+        return None
+
+    return decode_file_bytes(data)
+
 
 def guess_language_from_path(path: str) -> str:
     """Infer a markdown code fence language from a file path."""
 
-    ext = os.path.splitext(path)[1].lower()
-    return LANGUAGE_EXTENSIONS.get(ext, "")
+    # rpartition instead of os.path.splitext: one C-level scan, no parsing
+    # of the directory part. The guards keep splitext semantics — no dot,
+    # a dot inside a directory name, or a stem that is nothing but dots
+    # (".env", "..py") all mean "no extension".
+    head, sep, ext = path.rpartition(".")
+    if not sep or "/" in ext or os.sep in ext:
+        return ""
+    stem = head[max(head.rfind("/"), head.rfind(os.sep)) + 1 :]
+    if not stem.strip("."):
+        return ""
+    return LANGUAGE_EXTENSIONS.get("." + ext.lower(), "")
 
 
 def build_tree_from_paths(repo_name: str, paths: List[str]) -> str:
@@ -164,62 +294,322 @@ def build_tree_from_paths(repo_name: str, paths: List[str]) -> str:
             node = node.setdefault(part, {})
         node[parts[-1]] = None
 
-    def render_tree(tree: Dict[str, Dict], prefix: str = "") -> List[str]:
-        rendered: List[str] = []
-        entries = sorted(tree.items(), key=lambda item: (item[1] is None, item[0].lower()))
-        for idx, (name, child) in enumerate(entries):
-            connector = "└── " if idx == len(entries) - 1 else "├── "
-            rendered.append(f"{prefix}{connector}{name}")
-            if isinstance(child, dict):
-                extension = "    " if idx == len(entries) - 1 else "│   "
-                rendered.extend(render_tree(child, prefix + extension))
-        return rendered
+    def sort_key(item: tuple) -> tuple:
+        return (item[1] is None, item[0].lower())
 
     tree: Dict[str, Dict] = {}
     for path in paths:
         insert_path(tree, path)
 
     lines = [repo_name]
-    lines.extend(render_tree(tree))
+    # Depth-first render with an explicit stack instead of recursion;
+    # children are pushed in reverse so pop order matches the old
+    # top-to-bottom output, and no per-node result lists are allocated.
+    stack: List[tuple[str, Optional[Dict], str, bool]] = [
+        (name, child, "", idx == 0)
+        for idx, (name, child) in enumerate(sorted(tree.items(), key=sort_key, reverse=True))
+    ]
+    while stack:
+        name, child, prefix, is_last = stack.pop()
+        connector = "└── " if is_last else "├── "
+        lines.append(f"{prefix}{connector}{name}")
+        if isinstance(child, dict):
+            child_prefix = prefix + ("    " if is_last else "│   ")
+            stack.extend(
+                (child_name, grandchild, child_prefix, idx == 0)
+                for idx, (child_name, grandchild) in enumerate(
+                    sorted(child.items(), key=sort_key, reverse=True)
+                )
+            )
     return "\n".join(lines)
 
 
+# Single-pass replacement table; the old replace() chain copied the
+# string once per character class.
+_BRANCH_SLUG_TABLE = str.maketrans({"/": "_", " ": "_", "#": "_", "\\": "_", ":": "_"})
+
+
+@lru_cache(maxsize=None)
 def slugify_branch_name(branch_name: str) -> str:
     """Convert a branch name into a filesystem-friendly slug."""
 
-    return (
-        branch_name.replace("/", "_")
-        .replace(" ", "_")
-        .replace("#", "_")
-        .replace("\\", "_")
-        .replace(":", "_")
-    )
+    return branch_name.translate(_BRANCH_SLUG_TABLE)
 
 
 def sync_remote_branch(repo_path: str | Path, branch_name: str) -> None:
     """Ensure a local branch mirrors the remote branch content."""
 
-    run_git(repo_path, ["fetch", "origin", "--prune"])
+    fetch_if_stale(repo_path)
     run_git(repo_path, ["checkout", "-q", "-B", branch_name, f"origin/{branch_name}"])
 
 
-def collect_branch_markdown(repo_path: str | Path, branch_name: str) -> str:
-    """Check out a branch and turn all (reasonable) files into a big markdown document."""
+def decode_file_bytes(data: bytes) -> Optional[str]:
+    """Decode file bytes as UTF-8 with a latin-1 fallback; None for binary data."""
+
+    if is_binary_content(data[:4096]):
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        try:
+            return data.decode("latin-1")
+        except Exception:
+            return None
+
+
+class GitObjectReader:
+    """Long-lived `git cat-file --batch` process for bulk blob reads.
 
-    sync_remote_branch(repo_path, branch_name)
+    One spawned process answers any number of object lookups over its
+    stdin/stdout pipe, replacing a subprocess per blob. Reads are
+    serialized with a lock so a single reader can be shared across the
+    concurrent branch-collection threads.
+    """
 
-    repo_path = Path(repo_path)
-    repo_name = repo_path.name
+    def __init__(self, repo_path: str | Path):
+        self._proc = subprocess.Popen(
+            ["git", "-C", str(repo_path), "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self._lock = threading.Lock()
+
+    def read_object(self, name: str) -> Optional[bytes]:
+        """Return an object's bytes by SHA or ref, or None when missing."""
+
+        assert self._proc.stdin is not None and self._proc.stdout is not None
+        with self._lock:
+            self._proc.stdin.write(name.encode("utf-8") + b"\n")
+            self._proc.stdin.flush()
+
+            header = self._proc.stdout.readline()
+            if not header:
+                raise RuntimeError("git cat-file --batch terminated unexpectedly")
+
+            parts = header.split()
+            if len(parts) < 3:
+                return None
+            size = int(parts[2])
+            data = self._proc.stdout.read(size + 1)  # content plus trailing LF
+            return data[:size]
+
+    def close(self) -> None:
+        for stream in (self._proc.stdin, self._proc.stdout, self._proc.stderr):
+            if stream is not None:
+                stream.close()
+        self._proc.terminate()
+        self._proc.wait()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+
+def list_branch_blobs(repo_path: str | Path, ref: str) -> List[tuple[str, str, int]]:
+    """Return (path, blob_sha, size) for every regular file on a ref.
+
+    One `ls-tree -r` call enumerates the whole tree without touching blob
+    contents, which lets callers dedupe identical blobs across branches.
+    Stdout stays binary: records are filtered as bytes and only the paths
+    that survive get decoded, instead of decoding the whole listing.
+    """
+
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), "ls-tree", "-r", "-z", "--long", ref],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    blobs: List[tuple[str, str, int]] = []
+
+    for record in result.stdout.split(b"\0"):
+        if not record:
+            continue
+        meta, _, path = record.partition(b"\t")
+        parts = meta.split()
+        if len(parts) != 4:
+            continue
+        mode, obj_type, sha, size = parts
+        if obj_type != b"blob" or mode not in (b"100644", b"100755"):
+            continue
+        try:
+            blobs.append((path.decode("utf-8"), sha.decode("ascii"), int(size)))
+        except (ValueError, UnicodeDecodeError):
+            continue
+
+    return blobs
+
+
+def is_ignored_file(file_name: str) -> bool:
+    """True for files we keep out of prompts without reading them.
+
+    Covers generated files (lockfiles, minified assets) and
+    known-binary extensions, so the walk rejects them by name instead of
+    paying a read plus content sniff per file.
+    """
+
+    if file_name in IGNORED_FILES or file_name.endswith(IGNORED_FILE_SUFFIXES):
+        return True
+    return os.path.splitext(file_name)[1].lower() in BINARY_EXTENSIONS
+
+
+def _is_ignored_path(rel_path: str) -> bool:
+    parts = rel_path.split("/")
+    if is_ignored_file(parts[-1]):
+        return True
+    return any(part in IGNORED_DIRS for part in parts[:-1])
+
+
+def _collect_file_entries_from_blobs(
+    repo_path: Path,
+    ref: str,
+    blob_cache: Dict[str, Optional[str]],
+    reader: Optional[GitObjectReader] = None,
+) -> List[Dict[str, str]]:
+    """Collect file entries via ls-tree + a cross-branch blob cache.
+
+    Branches of the same repo share most blobs; only SHAs not seen before
+    are pulled (through a persistent cat-file reader), so the M-th branch
+    costs roughly its unique blobs.
+    """
+
+    kept: List[tuple[str, str]] = []
+    for path, sha, size in list_branch_blobs(repo_path, ref):
+        if size > MAX_FILE_SIZE_BYTES or _is_ignored_path(path):
+            continue
+        kept.append((path, sha))
+
+    misses = [sha for _path, sha in kept if sha not in blob_cache]
+    if misses:
+        owns_reader = reader is None
+        if owns_reader:
+            reader = GitObjectReader(repo_path)
+        try:
+            for sha in misses:
+                if sha in blob_cache:
+                    continue
+                data = reader.read_object(sha)
+                if data is None:
+                    blob_cache[sha] = None
+                    continue
+                text = decode_file_bytes(data)
+                blob_cache[sha] = text.rstrip() if text is not None else None
+        finally:
+            if owns_reader:
+                reader.close()
+
+    file_entries: List[Dict[str, str]] = []
+    for path, sha in kept:
+        content = blob_cache.get(sha)
+        if content is None:
+            continue
+        file_entries.append(
+            {
+                "path": path.replace("/", os.sep),
+                "content": content,
+                "language": guess_language_from_path(path),
+            }
+        )
+
+    return file_entries
+
+
+def _collect_file_entries_from_archive(repo_path: Path, ref: str) -> List[Dict[str, str]]:
+    """Stream a branch's tree from a single `git archive` call.
+
+    One tar pipe replaces a checkout plus per-file filesystem reads; raises
+    on any git failure so callers can fall back to the working-tree walk.
+    """
+
+    proc = subprocess.Popen(
+        ["git", "-C", str(repo_path), "archive", "--format=tar", ref],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
     file_entries: List[Dict[str, str]] = []
 
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+    try:
+        assert proc.stdout is not None
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tf:
+            for member in tf:
+                if not member.isfile():
+                    continue
+                if member.size > MAX_FILE_SIZE_BYTES:
+                    continue
+
+                rel_path = member.name
+                if _is_ignored_path(rel_path):
+                    continue
+
+                fileobj = tf.extractfile(member)
+                if fileobj is None:
+                    continue
+
+                text = decode_file_bytes(fileobj.read())
+                if text is None:
+                    continue
+
+                file_entries.append(
+                    {
+                        "path": rel_path.replace("/", os.sep),
+                        "content": text.rstrip(),
+                        "language": guess_language_from_path(rel_path),
+                    }
+                )
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+    return file_entries
+
+
+def _collect_file_entries_from_walk(repo_path: Path) -> List[Dict[str, str]]:
+    """Collect file entries by walking the checked-out working tree.
+
+    The walk itself is quick; the per-file reads dominate, so they run on
+    a thread pool to overlap read syscalls with decoding.
+    """
+
+    candidates: List[tuple[str, Path]] = []
+    root = str(repo_path).rstrip(os.sep)
+    # scandir paths all share the root prefix; slicing it off replaces a
+    # Path.relative_to parse per file.
+    prefix_len = len(root) + 1
+    stack: List[str] = [root]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                # No per-directory sort: the renderer globally sorts
+                # entries by path, which alone fixes the output order.
+                entries = list(it)
+        except OSError:
+            continue
+
+        for entry in entries:
+            # DirEntry answers type checks from the readdir cache — no
+            # extra stat per entry, unlike the old walk + getsize combo.
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in IGNORED_DIRS:
+                    stack.append(entry.path)
+            elif entry.is_file(follow_symlinks=False) and not is_ignored_file(entry.name):
+                candidates.append((entry.path[prefix_len:], Path(entry.path)))
+
+    if not candidates:
+        return []
 
-        for file_name in sorted(files):
-            full_path = Path(root) / file_name
-            rel_path = str(full_path.relative_to(repo_path))
+    workers = min(32, len(candidates))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        texts = pool.map(lambda item: read_text_file(item[1]), candidates)
 
-            text = read_text_file(full_path)
+        file_entries: List[Dict[str, str]] = []
+        for (rel_path, _full_path), text in zip(candidates, texts):
             if text is None:
                 continue
 
@@ -231,30 +621,185 @@ def collect_branch_markdown(repo_path: str | Path, branch_name: str) -> str:
                 }
             )
 
+    return file_entries
+
+
+def _render_branch_markdown(
+    repo_name: str, branch_name: str, file_entries: List[Dict[str, str]]
+) -> str:
     file_entries.sort(key=lambda entry: entry["path"].lower())
     tree_paths = [entry["path"] for entry in file_entries]
     tree = build_tree_from_paths(repo_name, tree_paths) if tree_paths else repo_name
 
-    lines: List[str] = []
-    lines.append(f"# Project: {repo_name} (Branch: {branch_name})")
-    lines.append("")
-    lines.append("## Project Structure")
-    lines.append("```")
-    lines.append(tree)
-    lines.append("```")
-    lines.append("---")
-    lines.append("## File Contents")
-
-    for entry in file_entries:
+    # A single growing StringIO buffer instead of a lines list plus a
+    # second full-size allocation from the final join.
+    buf = io.StringIO()
+    buf.write(f"# Project: {repo_name} (Branch: {branch_name})\n")
+    buf.write("\n")
+    buf.write("## Project Structure\n")
+    buf.write("```\n")
+    buf.write(tree)
+    buf.write("\n```\n")
+    buf.write("---\n")
+    buf.write("## File Contents\n")
+
+    # Embed duplicate bodies (vendored copies, generated fixtures) once and
+    # reference them afterwards; tiny files stay inline for readability.
+    seen_content: Dict[str, str] = {}
+
+    for idx, entry in enumerate(file_entries):
+        if idx:
+            buf.write("\n")
+        buf.write(f"### FILE: {entry['path']}\n")
+
+        content = entry["content"]
+        if len(content) >= 256:
+            first_path = seen_content.setdefault(content, entry["path"])
+            if first_path != entry["path"]:
+                buf.write(f"_Identical to `{first_path}` above._\n")
+                continue
+
         lang = entry["language"]
-        fence = f"```{lang}" if lang else "```"
-        lines.append(f"### FILE: {entry['path']}")
-        lines.append(fence)
-        lines.append(entry["content"])
-        lines.append("```")
-        lines.append("")
+        buf.write(f"```{lang}\n" if lang else "```\n")
+        buf.write(content)
+        buf.write("\n```\n")
+
+    return buf.getvalue()
+
+
+# The checkout fallback mutates the shared working tree; serialize it so
+# concurrent branch collection stays safe.
+_WORKTREE_LOCK = threading.Lock()
+
+
+def _branch_cache_dir(repo_name: str) -> Path:
+    return Path.home() / APP_DIR_NAME / "cache" / "branches" / repo_name
+
+
+def _read_branch_markdown_cache(repo_name: str, branch_name: str, sha: str) -> Optional[str]:
+    """Return the cached snapshot for a branch tip, or None on a miss.
+
+    Round-trips as bytes: read_text's newline translation would fold the
+    \\r\\n sequences of embedded CRLF files, making a cache hit differ
+    from a fresh render of the same tip.
+    """
+
+    cache_file = _branch_cache_dir(repo_name) / f"{slugify_branch_name(branch_name)}.{sha}.md"
+    try:
+        return cache_file.read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_branch_markdown_cache(
+    repo_name: str, branch_name: str, sha: str, markdown: str
+) -> None:
+    """Store a branch snapshot keyed by tip SHA, dropping stale entries.
+
+    Failures are ignored — the cache is purely an optimization.
+    """
+
+    slug = slugify_branch_name(branch_name)
+    cache_dir = _branch_cache_dir(repo_name)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob(f"{slug}.*.md"):
+            stale.unlink(missing_ok=True)
+        tmp_file = cache_dir / f"{slug}.{sha}.md.tmp"
+        tmp_file.write_bytes(markdown.encode("utf-8"))
+        os.replace(tmp_file, cache_dir / f"{slug}.{sha}.md")
+    except OSError:
+        pass
+
+
+def collect_branch_markdown(
+    repo_path: str | Path,
+    branch_name: str,
+    fetch: bool = True,
+    blob_cache: Optional[Dict[str, Optional[str]]] = None,
+    object_reader: Optional[GitObjectReader] = None,
+) -> str:
+    """Turn all (reasonable) files on a branch into a big markdown document.
+
+    Prefers streaming the tree through `git archive` (one git call, no
+    checkout); falls back to syncing the branch into the working tree and
+    walking it when archive is unavailable. Pass ``fetch=False`` when the
+    caller has already fetched origin, and a shared ``blob_cache`` to reuse
+    decoded blobs across branches.
+
+    Snapshots are memoized on disk keyed by the branch tip SHA, so
+    re-running a report on an unchanged branch skips collection entirely.
+    """
+
+    repo_path = Path(repo_path)
+    repo_name = repo_path.name
+    tip_sha: Optional[str] = None
 
-    return "\n".join(lines).rstrip() + "\n"
+    try:
+        if fetch:
+            fetch_if_stale(repo_path)
+        ref = f"origin/{branch_name}"
+        tip_sha = run_git(repo_path, ["rev-parse", ref]).strip() or None
+        if tip_sha:
+            cached = _read_branch_markdown_cache(repo_name, branch_name, tip_sha)
+            if cached is not None:
+                return cached
+        if blob_cache is not None:
+            file_entries = _collect_file_entries_from_blobs(
+                repo_path, ref, blob_cache, reader=object_reader
+            )
+        else:
+            file_entries = _collect_file_entries_from_archive(repo_path, ref)
+    except Exception:
+        # The walk sees whatever is on disk, which may not match the ref
+        # exactly — don't memoize it.
+        tip_sha = None
+        with _WORKTREE_LOCK:
+            sync_remote_branch(repo_path, branch_name)
+            file_entries = _collect_file_entries_from_walk(repo_path)
+
+    markdown = _render_branch_markdown(repo_name, branch_name, file_entries)
+    if tip_sha:
+        _write_branch_markdown_cache(repo_name, branch_name, tip_sha, markdown)
+    return markdown
+
+
+def collect_branches_markdown(
+    repo_path: str | Path, branch_names: List[str], max_workers: Optional[int] = None
+) -> Dict[str, str]:
+    """Collect markdown snapshots for several branches concurrently.
+
+    One fetch up front, then one `git archive` pipe per branch driven from
+    a thread pool — the heavy lifting happens in git subprocesses and file
+    I/O, both of which release the GIL, so threads give near-linear scaling
+    with branch count without process-pool pickling overhead.
+    """
+
+    branch_names = list(branch_names)
+    if not branch_names:
+        return {}
+    if len(branch_names) == 1:
+        name = branch_names[0]
+        return {name: collect_branch_markdown(repo_path, name)}
+
+    try:
+        fetch_if_stale(repo_path)
+    except (subprocess.CalledProcessError, OSError):
+        pass  # per-branch collection falls back to its own sync
+
+    workers = max_workers or min(len(branch_names), os.cpu_count() or 4)
+    blob_cache: Dict[str, Optional[str]] = {}
+    with GitObjectReader(repo_path) as reader, ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            lambda name: (
+                name,
+                collect_branch_markdown(
+                    repo_path, name, fetch=False, blob_cache=blob_cache, object_reader=reader
+                ),
+            ),
+            branch_names,
+        )
+        return dict(results)
 
 
 def build_single_branch_prompt(prompt_name: str, branch_markdown: str) -> str:
@@ -272,56 +817,176 @@ def build_single_branch_prompt(prompt_name: str, branch_markdown: str) -> str:
     )
 
 
-def build_document_body(
+def _document_body_parts(
     spec_path: Optional[str], spec_content: str, branch_markdown: Dict[str, str]
-) -> str:
-    """Build the combined specification + branch content section (without prompts)."""
+) -> List[str]:
+    """Assemble the combined spec + branch section as a list of parts.
+
+    The parts hold references to the (large) branch strings rather than
+    copies, so callers can either join or stream them.
+    """
 
     parts: List[str] = []
 
     parts.append("# Specifications and design docs and prompts")
     parts.append("")
 
-    if spec_content.strip():
+    # Strip once; multi-MB spec files should not be copied per check.
+    spec_body = spec_content.rstrip()
+    if spec_body:
         if spec_path:
             parts.append(f"_Source: `{spec_path}`_")
         parts.append("")
-        parts.append(spec_content.rstrip())
+        parts.append(spec_body)
         parts.append("")
     else:
         parts.append("_No specification was provided for this project._\n")
 
-    for branch_name in branch_markdown:
+    # Deterministic section order: detection order varies run to run, and
+    # a stable layout keeps re-runs byte-identical up to the first changed
+    # branch (see the prompt-cache note on build_branch_comparison_prompt).
+    for branch_name in sorted(branch_markdown):
         parts.append(f"# {branch_name} branch content")
         parts.append("")
         parts.append(branch_markdown[branch_name].rstrip())
         parts.append("")
 
-    return "\n".join(parts)
+    return parts
 
 
-def build_branch_comparison_prompt(
+def build_document_body(
     spec_path: Optional[str], spec_content: str, branch_markdown: Dict[str, str]
 ) -> str:
-    """Build the single, copy-paste-ready prompt for comparing branches."""
+    """Build the combined specification + branch content section (without prompts)."""
+
+    return "\n".join(_document_body_parts(spec_path, spec_content, branch_markdown))
 
-    document_body = build_document_body(spec_path, spec_content, branch_markdown)
-    branch_names = list(branch_markdown.keys())
+
+def _comparison_prompt_parts(
+    spec_path: Optional[str], spec_content: str, branch_markdown: Dict[str, str]
+) -> List[str]:
+    body = _document_body_parts(spec_path, spec_content, branch_markdown)
+    # Equivalent of rstrip() on the joined body, chunk by chunk.
+    while body and not body[-1].strip():
+        body.pop()
+    if body:
+        body[-1] = body[-1].rstrip()
+
+    branch_names = sorted(branch_markdown)
     branches_display = ", ".join(f"`{name}`" for name in branch_names) if branch_names else "None"
     system_prompt = prompts.load_prompt("branch_comparison")
 
-    parts: List[str] = [
+    return [
         system_prompt.strip(),
         "",
         "Here is the combined specification and branch content markdown.",
         f"The branches to compare are: {branches_display}.",
         "",
         "---------------- BEGIN DOCUMENT ----------------",
-        document_body.rstrip(),
+        *body,
         "---------------- END DOCUMENT ----------------",
     ]
 
-    return "\n".join(parts)
+
+def build_branch_comparison_prompt(
+    spec_path: Optional[str], spec_content: str, branch_markdown: Dict[str, str]
+) -> str:
+    """Build the single, copy-paste-ready prompt for comparing branches.
+
+    The stable content (system prompt, then spec) deliberately leads and
+    the per-branch sections trail, so re-runs with an added branch share a
+    byte-identical prefix and can hit provider-side prompt caches when the
+    document is pasted into an AI chat.
+    """
+
+    return "\n".join(_comparison_prompt_parts(spec_path, spec_content, branch_markdown))
+
+
+def write_branch_comparison_prompt(
+    output_path: str | Path,
+    spec_path: Optional[str],
+    spec_content: str,
+    branch_markdown: Dict[str, str],
+) -> None:
+    """Stream the comparison prompt to disk without joining it in memory.
+
+    Writes the same bytes as :func:`build_branch_comparison_prompt`, but
+    the full document never exists as a single Python string — peak memory
+    stays at the already-held per-branch markdown.
+    """
+
+    parts = _comparison_prompt_parts(spec_path, spec_content, branch_markdown)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(parts[0])
+        for part in parts[1:]:
+            f.write("\n")
+            f.write(part)
+
+
+def local_origin_path(repo_path: str | Path) -> Optional[Path]:
+    """Return origin's directory when the remote lives on the local filesystem."""
+
+    try:
+        url = run_git(repo_path, ["config", "--get", "remote.origin.url"])
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+    if not url:
+        return None
+    if url.startswith("file://"):
+        url = url[len("file://") :]
+    if not url.startswith("/"):
+        return None
+
+    path = Path(url)
+    return path if path.is_dir() else None
+
+
+def local_refs_fingerprint(origin_path: Path) -> Optional[tuple]:
+    """Fingerprint a local repository's branch refs via stat, without git.
+
+    Covers loose refs under refs/heads plus packed-refs, so the monitor
+    loop can idle on unchanged local mirrors with a handful of stat calls
+    instead of spawning git every poll.
+    """
+
+    git_dir = origin_path / ".git" if (origin_path / ".git").is_dir() else origin_path
+    entries: List[tuple] = []
+
+    try:
+        packed = git_dir / "packed-refs"
+        if packed.exists():
+            st = packed.stat()
+            entries.append(("packed-refs", st.st_mtime_ns, st.st_size))
+
+        heads = git_dir / "refs" / "heads"
+        if heads.is_dir():
+            for root, _dirs, files in os.walk(heads):
+                for name in files:
+                    st = (Path(root) / name).stat()
+                    entries.append((os.path.join(root, name), st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+
+    return tuple(sorted(entries)) if entries else None
+
+
+def remote_heads_signature(repo_path: str | Path) -> str:
+    """Return a digest of origin's advertised branch heads.
+
+    `ls-remote --heads` only transfers the ref advertisement, so callers can
+    compare digests between polls and skip a full fetch when nothing moved.
+    """
+
+    out = run_git(repo_path, ["ls-remote", "--heads", "origin"]) or ""
+    return hashlib.blake2b(out.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def remote_heads_signature_async(repo_path: str | Path) -> str:
+    """Async variant of :func:`remote_heads_signature` for event-loop callers."""
+
+    out = await run_git_async(repo_path, ["ls-remote", "--heads", "origin"]) or ""
+    return hashlib.blake2b(out.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def get_remote_branch_names(repo_path: str | Path) -> Set[str]:
@@ -344,27 +1009,33 @@ def get_remote_branch_names(repo_path: str | Path) -> Set[str]:
     return branches
 
 
+# Diffs between two fixed commits never change; memoize successful
+# results so repeated report builds skip the git calls entirely.
+_DIFF_CACHE: Dict[tuple, DiffResult] = {}
+
+
 def compute_branch_diff(
     repo_path: str | Path, branch_name: str, base_branch: str = "main"
 ) -> DiffResult:
     """Return the git diff between the PR branch and the base branch as a structured result."""
 
     repo_path = Path(repo_path)
-    run_git(repo_path, ["fetch", "origin", "--prune"])
+    fetch_if_stale(repo_path)
 
     branch_ref = f"origin/{branch_name}"
     base_ref = f"origin/{base_branch}"
 
-    def ref_exists(ref: str) -> bool:
-        result = subprocess.run(
-            ["git", "-C", str(repo_path), "show-ref", "--verify", "--quiet", f"refs/remotes/{ref}"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        return result.returncode == 0
-
-    missing_refs = [ref for ref in (base_ref, branch_ref) if not ref_exists(ref)]
+    # One show-ref call checks both refs at once; its exit code only says
+    # whether anything matched, so parse stdout for which refs exist.
+    wanted = {f"refs/remotes/{ref}": ref for ref in (base_ref, branch_ref)}
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), "show-ref", *wanted],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    found = {line.split()[-1] for line in (result.stdout or "").splitlines() if line.strip()}
+    missing_refs = [ref for full_name, ref in wanted.items() if full_name not in found]
     if missing_refs:
         missing_list = ", ".join(missing_refs)
         return DiffResult(
@@ -376,7 +1047,38 @@ def compute_branch_diff(
             ),
         )
 
+    # Key the cache on the resolved commits; the lookup is skipped when
+    # rev-parse fails (e.g. the refs moved away mid-run).
+    cache_key: Optional[tuple] = None
+    try:
+        shas = run_git(repo_path, ["rev-parse", base_ref, branch_ref]).split()
+        if len(shas) == 2:
+            cache_key = (str(repo_path), shas[0], shas[1])
+    except Exception:
+        cache_key = None
+    if cache_key is not None and cache_key in _DIFF_CACHE:
+        return _DIFF_CACHE[cache_key]
+
+    def finish(diff_result: DiffResult) -> DiffResult:
+        if cache_key is not None:
+            if len(_DIFF_CACHE) >= 32:
+                _DIFF_CACHE.clear()
+            _DIFF_CACHE[cache_key] = diff_result
+        return diff_result
+
     try:
+        changed_files = run_git(
+            repo_path, ["diff", f"{base_ref}...{branch_ref}", "--name-only", "-z"]
+        )
+        if not changed_files.strip("\0").strip():
+            return finish(
+                DiffResult(
+                    ok=True,
+                    has_changes=False,
+                    message=f"No differences between {branch_ref} and {base_ref}.",
+                )
+            )
+
         diff_output = run_git(repo_path, ["diff", f"{base_ref}...{branch_ref}"])
     except subprocess.CalledProcessError:
         return DiffResult(
@@ -389,13 +1091,17 @@ def compute_branch_diff(
         )
 
     if not diff_output.strip():
-        return DiffResult(
-            ok=True,
-            has_changes=False,
-            message=f"No differences between {branch_ref} and {base_ref}.",
+        return finish(
+            DiffResult(
+                ok=True,
+                has_changes=False,
+                message=f"No differences between {branch_ref} and {base_ref}.",
+            )
         )
 
-    return DiffResult(ok=True, has_changes=True, message="", diff_text=diff_output.strip())
+    return finish(
+        DiffResult(ok=True, has_changes=True, message="", diff_text=diff_output.strip())
+    )
 
 
 def build_pr_mega_prompt(
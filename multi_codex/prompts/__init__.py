@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.resources as resources
+from functools import lru_cache
 from typing import Dict
 
 PROMPT_FILES: Dict[str, str] = {
@@ -13,8 +14,13 @@ PROMPT_FILES: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=None)
 def load_prompt(name: str) -> str:
-    """Load a prompt markdown file by logical name."""
+    """Load a prompt markdown file by logical name.
+
+    The packaged prompts are static, so results are cached; repeated
+    report builds reuse the string instead of re-reading package data.
+    """
 
     if name not in PROMPT_FILES:
         raise KeyError(f"Unknown prompt '{name}'")
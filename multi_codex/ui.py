@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Set
@@ -58,8 +60,25 @@ QUESTIONARY_STYLE = QStyle([
 ])
 
 POLL_INTERVAL_SECONDS = 30
+# The no-change checks (ls-remote digest, local refs fingerprint) are cheap
+# enough to run far more often than a full fetch, cutting detection latency.
+IDLE_POLL_INTERVAL_SECONDS = 5
 TOKEN_WARNING_THRESHOLD = 128_000
 
+# Fixed prompts used on every iteration of the monitor loop; built once at
+# import time so the polling hot path only prints.
+MONITOR_PANEL_TEXT = (
+    "Monitoring origin for fresh branches. When a branch ships, you'll decide whether to add it to the evaluation queue.\n"
+    "Start analysis at any time or keep watching for more contenders. Press Ctrl+C when you're ready to switch to analysis."
+)
+PROMPT_START_ANALYSIS_NOW = "Start analysis now? (Otherwise I'll keep monitoring for more branches.)"
+PROMPT_START_WITH_QUEUED = "Would you like to start analysis with the branches already queued?"
+PROMPT_START_WITH_EMPTY_QUEUE = (
+    "Start analysis now even though no branches are queued yet? (You can always resume monitoring.)"
+)
+MSG_STARTING_ANALYSIS = "[cyan]Starting analysis with the current set of branches...[/cyan]\n"
+MSG_LAUNCHING_ANALYSIS = "[cyan]Launching analysis with the current lineup...[/cyan]\n"
+
 BANNER_LINES = [
     "░███     ░███            ░██    ░██    ░██                             ░██",
     "░████   ░████            ░██    ░██                                    ░██",
@@ -163,6 +182,11 @@ def print_status(message: str, status: str = "info") -> None:
         "thinking": (ICON_THINKING, "magenta"),
     }
     icon, color = icons.get(status, (ICON_BULLET, "white"))
+    if not console.is_terminal:
+        # Redirected output (CI logs, files) gets no color anyway; skip the
+        # markup parse and styling work entirely.
+        console.print(f"{icon} {message}", markup=False, highlight=False)
+        return
     console.print(f"[{color}]{icon}[/{color}] {message}")
 
 
@@ -239,7 +263,7 @@ def ensure_local_clone(repo_url: str, repo_path: Path) -> None:
             console=console,
         ) as progress:
             fetch_task = progress.add_task("Fetching latest changes from origin...", start=True)
-            core.run_git(repo_path, ["fetch", "origin", "--prune"])
+            core.fetch_if_stale(repo_path)
             progress.update(fetch_task, advance=1)
         return
 
@@ -273,11 +297,45 @@ def ensure_local_clone(repo_url: str, repo_path: Path) -> None:
             raise typer.Exit(code=1)
 
 
+# Single worker so overlapping prompts can't pile up concurrent fetches
+# against the same clone.
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bg-fetch")
+
+
+def start_background_fetch(repo_path: Path) -> None:
+    """Kick off a debounced origin fetch without blocking the caller.
+
+    Called before interactive prompts so the network round-trip overlaps
+    the time the user spends typing; the debounce in core.fetch_if_stale
+    then makes the follow-up foreground fetch a no-op. Errors are
+    swallowed here — the next foreground git call will surface them.
+    """
+
+    def _fetch() -> None:
+        try:
+            core.fetch_if_stale(repo_path)
+        except Exception:
+            pass
+
+    _FETCH_EXECUTOR.submit(_fetch)
+
+
+_WHICH_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _which_cached(name: str) -> Optional[str]:
+    """Cache shutil.which results; each lookup walks and stats every $PATH entry."""
+
+    if name not in _WHICH_CACHE:
+        _WHICH_CACHE[name] = shutil.which(name)
+    return _WHICH_CACHE[name]
+
+
 def copy_to_clipboard(text: str) -> bool:
     platform = sys.platform
 
     if platform == "darwin":
-        if shutil.which("pbcopy") is None:
+        if _which_cached("pbcopy") is None:
             return False
         try:
             subprocess.run(["pbcopy"], input=text, text=True, check=True)
@@ -286,7 +344,7 @@ def copy_to_clipboard(text: str) -> bool:
             return False
 
     if platform.startswith("win"):
-        if shutil.which("clip") is None:
+        if _which_cached("clip") is None:
             return False
         try:
             subprocess.run(["clip"], input=text, text=True, check=True)
@@ -295,14 +353,14 @@ def copy_to_clipboard(text: str) -> bool:
             return False
 
     if platform.startswith("linux"):
-        if shutil.which("wl-copy") is not None:
+        if _which_cached("wl-copy") is not None:
             try:
                 subprocess.run(["wl-copy"], input=text, text=True, check=True)
                 return True
             except subprocess.CalledProcessError:
                 return False
 
-        if shutil.which("xclip") is not None:
+        if _which_cached("xclip") is not None:
             try:
                 subprocess.run(["xclip", "-selection", "clipboard"], input=text, text=True, check=True)
                 return True
@@ -349,7 +407,7 @@ def select_branch(branches: List[str], prompt: str) -> Optional[str]:
 
 def prompt_for_branch_selection(repo_path: Path, action_label: str) -> str:
     with show_thinking("Fetching branches"):
-        core.run_git(repo_path, ["fetch", "origin", "--prune"])
+        core.fetch_if_stale(repo_path)
     branches = sorted(core.get_remote_branch_names(repo_path))
 
     if not branches:
@@ -420,11 +478,14 @@ def print_saved_file(label: str, path: Path) -> None:
 async def monitor_branches(repo_path: Path) -> Dict[str, BranchSpec]:
     selected: Dict[str, BranchSpec] = {}
     seen_branches: Set[str] = set()
+    last_heads_signature: Optional[str] = None
+    local_origin = core.local_origin_path(repo_path)
+    last_refs_fingerprint: Optional[tuple] = None
+    tracking_line = ""
 
     console.print(
         Panel(
-            "Monitoring origin for fresh branches. When a branch ships, you'll decide whether to add it to the evaluation queue.\n"
-            "Start analysis at any time or keep watching for more contenders. Press Ctrl+C when you're ready to switch to analysis.",
+            MONITOR_PANEL_TEXT,
             style="cyan",
             box=box.ROUNDED,
         )
@@ -432,41 +493,71 @@ async def monitor_branches(repo_path: Path) -> Dict[str, BranchSpec]:
 
     try:
         while True:
+            refs_fingerprint: Optional[tuple] = None
+            if local_origin is not None:
+                refs_fingerprint = core.local_refs_fingerprint(local_origin)
+                if refs_fingerprint is not None and refs_fingerprint == last_refs_fingerprint:
+                    await asyncio.sleep(IDLE_POLL_INTERVAL_SECONDS)
+                    continue
+
             try:
-                await asyncio.to_thread(core.run_git, repo_path, ["fetch", "origin", "--prune"])
+                heads_signature = await core.remote_heads_signature_async(repo_path)
+            except Exception:
+                heads_signature = None
+
+            if heads_signature is not None and heads_signature == last_heads_signature:
+                last_refs_fingerprint = refs_fingerprint
+                await asyncio.sleep(IDLE_POLL_INTERVAL_SECONDS)
+                continue
+
+            # An unconditional fetch, not fetch_if_stale: the digest says the
+            # remote moved, and a debounced no-op here would record the new
+            # signature while local refs still lack the change — silently
+            # freezing branch detection.
+            try:
+                await asyncio.to_thread(core.fetch_now, repo_path)
             except Exception:
                 await asyncio.sleep(POLL_INTERVAL_SECONDS)
                 continue
 
+            # Recorded only once the poll got this far; a failed fetch must
+            # not freeze the cheap fingerprint check on a stale value.
+            last_heads_signature = heads_signature
+            last_refs_fingerprint = refs_fingerprint
+
             remote_branches = core.get_remote_branch_names(repo_path)
-            new_branches = sorted(remote_branches - seen_branches)
+            if remote_branches == seen_branches:
+                new_branches: List[str] = []
+            else:
+                new_branches = sorted(remote_branches - seen_branches)
 
             for branch in new_branches:
                 console.print(f"[green]● New branch detected:[/green] [grey]{branch}[/grey]")
-                branch_label = f"'{branch}'"
-                add_prompt = f"Add {branch_label} to the evaluation lineup?"
-                if ask_yes_no(add_prompt, default=True):
+                if ask_yes_no(f"Add '{branch}' to the evaluation lineup?", default=True):
                     selected[branch] = BranchSpec(name=branch)
+                    tracking_line = ""
                     console.print(f"[green]Branch '{branch}' added to the evaluation set.[/green]\n")
 
-                    if ask_yes_no("Start analysis now? (Otherwise I'll keep monitoring for more branches.)", default=False):
-                        console.print("[cyan]Starting analysis with the current set of branches...[/cyan]\n")
+                    if ask_yes_no(PROMPT_START_ANALYSIS_NOW, default=False):
+                        console.print(MSG_STARTING_ANALYSIS)
                         return selected
                 else:
                     console.print(f"[yellow]Skipping branch '{branch}'.[/yellow]")
-                    start_prompt = "Would you like to start analysis with the branches already queued?"
+                    start_prompt = PROMPT_START_WITH_QUEUED
                     if not selected:
-                        start_prompt = "Start analysis now even though no branches are queued yet? (You can always resume monitoring.)"
+                        start_prompt = PROMPT_START_WITH_EMPTY_QUEUE
 
                     if ask_yes_no(start_prompt, default=False):
-                        console.print("[cyan]Launching analysis with the current lineup...[/cyan]\n")
+                        console.print(MSG_LAUNCHING_ANALYSIS)
                         return selected
 
             seen_branches = remote_branches
 
             if selected:
-                tracked = ", ".join(sorted(selected.keys()))
-                console.print(f"[grey]Currently tracking branches: {tracked}[/grey]")
+                if not tracking_line:
+                    tracked = ", ".join(sorted(selected.keys()))
+                    tracking_line = f"[grey]Currently tracking branches: {tracked}[/grey]"
+                console.print(tracking_line)
 
             await asyncio.sleep(POLL_INTERVAL_SECONDS)
 
@@ -484,7 +575,19 @@ def compute_token_count(text: str, model: str = "gpt-4o-mini") -> int:
     return len(encoding.encode(text))
 
 
-def warn_if_large(label: str, text: str) -> None:
+def report_token_hotspots(branch_markdown: Dict[str, str]) -> None:
+    """List per-branch token estimates, largest first, to guide trimming."""
+
+    rows = sorted(
+        ((compute_token_count(md), name) for name, md in branch_markdown.items()),
+        reverse=True,
+    )
+    console.print("[yellow]Largest branch sections:[/yellow]")
+    for tokens, name in rows:
+        console.print(f"  {ICON_BRANCH} {name}: ~{tokens:,} tokens")
+
+
+def warn_if_large(label: str, text: str) -> int:
     tokens = compute_token_count(text)
     if tokens > TOKEN_WARNING_THRESHOLD:
         console.print(
@@ -497,10 +600,15 @@ def warn_if_large(label: str, text: str) -> None:
         )
     else:
         console.print(f"[green]{label} token estimate: {tokens} tokens.[/green]")
+    return tokens
 
 
 def save_and_notify(prompt_text: str, output_path: Path, label: str) -> None:
-    output_path.write_text(prompt_text, encoding="utf-8")
+    data = prompt_text.encode("utf-8")
+    if output_path.is_file() and hashlib.sha256(output_path.read_bytes()).digest() == hashlib.sha256(data).digest():
+        print_status(f"{label} is unchanged since the last run; keeping the existing file.", "info")
+    else:
+        output_path.write_bytes(data)
     print_saved_file(label, output_path)
     warn_if_large(label, prompt_text)
     if copy_to_clipboard(prompt_text):
@@ -534,6 +642,7 @@ def run_architecture(repo_path: Path, report_path: Path) -> None:
 
 def run_compare(repo_path: Path, report_path: Path) -> None:
     print_section("Branch comparison", "Queue branches and merge specs")
+    start_background_fetch(repo_path)
     spec_path, spec_content = prompt_for_project_spec()
 
     branch_specs = asyncio.run(monitor_branches(repo_path))
@@ -542,25 +651,28 @@ def run_compare(repo_path: Path, report_path: Path) -> None:
         print_status("No branches were selected for evaluation. Exiting.", "warning")
         return
 
-    print_status("Generating markdown snapshot for each selected branch...", "thinking")
-    branch_markdown: Dict[str, str] = {}
-
-    for branch_name, bs in branch_specs.items():
-        with show_thinking(f"Processing branch: {branch_name}"):
-            md_text = core.collect_branch_markdown(repo_path, branch_name)
-        branch_markdown[branch_name] = md_text
+    print_status("Generating markdown snapshots for the selected branches...", "thinking")
+    with show_thinking(f"Processing {len(branch_specs)} branch(es)"):
+        branch_markdown = core.collect_branches_markdown(repo_path, list(branch_specs))
 
+    def _save_branch(branch_name: str) -> Path:
         branch_slug = core.slugify_branch_name(branch_name)
         branch_md_path = report_path / f"branch_{branch_slug}.md"
-        branch_md_path.write_text(md_text, encoding="utf-8")
-        bs.branch_markdown_path = branch_md_path
-        print_status(f"Branch markdown saved: {branch_md_path}", "success")
+        branch_md_path.write_text(branch_markdown[branch_name], encoding="utf-8")
+        return branch_md_path
 
-    with show_thinking("Building comparison prompt"):
-        combined_prompt = core.build_branch_comparison_prompt(spec_path, spec_content, branch_markdown)
-    combined_prompt_path = report_path / "combined_spec_and_branches.md"
+    # Write the per-branch files concurrently; console output stays on the
+    # main thread so the status lines keep a deterministic order.
+    with ThreadPoolExecutor(max_workers=min(4, len(branch_specs))) as pool:
+        for branch_name, branch_md_path in zip(branch_specs, pool.map(_save_branch, branch_specs)):
+            branch_specs[branch_name].branch_markdown_path = branch_md_path
+            print_status(f"Branch markdown saved: {branch_md_path}", "success")
 
-    combined_prompt_path.write_text(combined_prompt, encoding="utf-8")
+    combined_prompt_path = report_path / "combined_spec_and_branches.md"
+    with show_thinking("Building comparison prompt"):
+        core.write_branch_comparison_prompt(
+            combined_prompt_path, spec_path, spec_content, branch_markdown
+        )
 
     console.print(
         Panel(
@@ -572,6 +684,9 @@ def run_compare(repo_path: Path, report_path: Path) -> None:
     print_saved_file(f"  {ICON_ARROW} Path", combined_prompt_path)
     console.print("  (Contents intentionally not printed to avoid console noise)\n")
 
+    # Read back once for clipboard/token work; the prompt is streamed to
+    # disk above instead of being assembled in memory.
+    combined_prompt = combined_prompt_path.read_text(encoding="utf-8")
     copied = copy_to_clipboard(combined_prompt)
     print_status("Next step: share with your AI assistant (Claude, ChatGPT, Gemini, etc.)", "info")
     if copied:
@@ -579,7 +694,9 @@ def run_compare(repo_path: Path, report_path: Path) -> None:
     else:
         print_status("Copy the combined prompt file to your clipboard from the path above.", "warning")
 
-    warn_if_large("Combined spec and branches prompt", combined_prompt)
+    tokens = warn_if_large("Combined spec and branches prompt", combined_prompt)
+    if tokens > TOKEN_WARNING_THRESHOLD:
+        report_token_hotspots(branch_markdown)
     print_status("Done! Thank you for using multi-codex.", "success")
 
 
@@ -700,6 +817,7 @@ def launch_interactive() -> None:
         ),
     ]
 
+    start_background_fetch(repo_path)
     action = choose_action(actions)
 
     if action is None:
@@ -1,3 +1,4 @@
+import io
 from types import SimpleNamespace
 
 import multi_codex.core as core
@@ -94,12 +95,17 @@ def test_build_branch_comparison_prompt(monkeypatch):
     assert "branch b" in combined
 
 
-def test_compute_branch_diff_handles_missing_refs(monkeypatch, tmp_path):
-    existing_refs = {"refs/remotes/origin/main"}
-
+def _fake_show_ref(existing_refs):
     def fake_subprocess_run(cmd, check=False, stdout=None, stderr=None, text=None):
-        ref = cmd[-1]
-        return SimpleNamespace(returncode=0 if ref in existing_refs else 1, stdout="", stderr="")
+        queried = [arg for arg in cmd if arg.startswith("refs/")]
+        lines = [f"0000000 {ref}" for ref in queried if ref in existing_refs]
+        return SimpleNamespace(returncode=0 if lines else 1, stdout="\n".join(lines), stderr="")
+
+    return fake_subprocess_run
+
+
+def test_compute_branch_diff_handles_missing_refs(monkeypatch, tmp_path):
+    fake_subprocess_run = _fake_show_ref({"refs/remotes/origin/main"})
 
     monkeypatch.setattr(core, "subprocess", SimpleNamespace(run=fake_subprocess_run, PIPE=None))
     monkeypatch.setattr(core, "run_git", lambda repo, args: "")
@@ -111,11 +117,9 @@ def test_compute_branch_diff_handles_missing_refs(monkeypatch, tmp_path):
 
 
 def test_compute_branch_diff_with_and_without_changes(monkeypatch, tmp_path):
-    existing_refs = {"refs/remotes/origin/main", "refs/remotes/origin/feature"}
-
-    def fake_subprocess_run(cmd, check=False, stdout=None, stderr=None, text=None):
-        ref = cmd[-1]
-        return SimpleNamespace(returncode=0 if ref in existing_refs else 1, stdout="", stderr="")
+    fake_subprocess_run = _fake_show_ref(
+        {"refs/remotes/origin/main", "refs/remotes/origin/feature"}
+    )
 
     def fake_run_git(repo, args):
         if args[0] == "fetch":
@@ -170,3 +174,109 @@ def test_build_reports_use_correct_prompts(monkeypatch):
 
     assert "PROMPT:architecture_report" in arch
     assert "PROMPT:feature_security_modernization" in feature
+
+
+def test_is_ignored_file_rejects_generated_and_binary_names():
+    assert core.is_ignored_file("package-lock.json")
+    assert core.is_ignored_file("yarn.lock")
+    assert core.is_ignored_file("bundle.min.js")
+    assert core.is_ignored_file("styles.min.css")
+    assert core.is_ignored_file("app.js.map")
+    assert core.is_ignored_file("logo.png")
+    assert core.is_ignored_file("ARCHIVE.ZIP")
+    assert not core.is_ignored_file("main.py")
+    assert not core.is_ignored_file("README.md")
+
+
+def test_render_branch_markdown_dedupes_large_duplicates():
+    big = "x" * 300
+    entries = [
+        {"path": "b_copy.py", "content": big, "language": "python"},
+        {"path": "a_original.py", "content": big, "language": "python"},
+        {"path": "small_one.txt", "content": "tiny", "language": ""},
+        {"path": "small_two.txt", "content": "tiny", "language": ""},
+    ]
+
+    md = core._render_branch_markdown("repo", "feature", entries)
+
+    # The first occurrence in path order is embedded; the later copy
+    # becomes a reference instead of a second body.
+    assert md.count(big) == 1
+    assert md.index("### FILE: a_original.py") < md.index("### FILE: b_copy.py")
+    assert "_Identical to `a_original.py` above._" in md
+    # Content below the 256-char threshold stays inline everywhere.
+    assert md.count("tiny") == 2
+
+
+def test_fetch_if_stale_debounces_back_to_back_calls(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(core, "run_git", lambda repo, args: calls.append(args))
+
+    assert core.fetch_if_stale(tmp_path) is True
+    assert core.fetch_if_stale(tmp_path) is False
+    assert len(calls) == 1
+
+
+def test_branch_markdown_cache_roundtrip_and_stale_cleanup(monkeypatch, tmp_path):
+    monkeypatch.setattr(core.Path, "home", lambda: tmp_path)
+
+    # CRLF content must survive the round trip byte-for-byte; newline
+    # translation on read would make a cache hit differ from a fresh render.
+    crlf_snapshot = "NEW\r\nSNAPSHOT\r\n"
+    core._write_branch_markdown_cache("repo", "feature", "a" * 40, "OLD SNAPSHOT")
+    core._write_branch_markdown_cache("repo", "feature", "b" * 40, crlf_snapshot)
+
+    assert core._read_branch_markdown_cache("repo", "feature", "b" * 40) == crlf_snapshot
+    assert core._read_branch_markdown_cache("repo", "feature", "a" * 40) is None
+    cache_dir = tmp_path / ".multi_codex" / "cache" / "branches" / "repo"
+    assert [p.name for p in cache_dir.iterdir()] == [f"feature.{'b' * 40}.md"]
+
+
+def test_collect_branch_markdown_returns_cached_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setattr(core.Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(core, "fetch_if_stale", lambda repo_path: False)
+    monkeypatch.setattr(core, "run_git", lambda repo, args: "c" * 40)
+
+    core._write_branch_markdown_cache("repo", "feature", "c" * 40, "CACHED SNAPSHOT")
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    assert core.collect_branch_markdown(repo, "feature") == "CACHED SNAPSHOT"
+
+
+def test_list_branch_blobs_keeps_only_regular_file_blobs(monkeypatch, tmp_path):
+    records = (
+        b"100644 blob aaa111 5\tsrc/a.py\0"
+        b"040000 tree bbb222 -\tsrc\0"
+        b"120000 blob ccc333 3\tsymlink\0"
+        b"100755 blob ddd444 7\tscript.sh\0"
+    )
+
+    def fake_subprocess_run(cmd, check=False, stdout=None, stderr=None):
+        return SimpleNamespace(returncode=0, stdout=records, stderr=b"")
+
+    monkeypatch.setattr(core, "subprocess", SimpleNamespace(run=fake_subprocess_run, PIPE=None))
+
+    blobs = core.list_branch_blobs(tmp_path, "origin/feature")
+
+    assert blobs == [("src/a.py", "aaa111", 5), ("script.sh", "ddd444", 7)]
+
+
+def test_git_object_reader_parses_hits_and_missing_objects(monkeypatch):
+    class FakePopen:
+        def __init__(self, cmd, stdin=None, stdout=None, stderr=None):
+            self.stdin = io.BytesIO()
+            self.stdout = io.BytesIO(b"aaa111 blob 5\nhello\nbbb222 missing\n")
+            self.stderr = io.BytesIO()
+
+        def terminate(self):
+            pass
+
+        def wait(self):
+            pass
+
+    monkeypatch.setattr(core, "subprocess", SimpleNamespace(Popen=FakePopen, PIPE=None))
+
+    with core.GitObjectReader("/tmp/repo") as reader:
+        assert reader.read_object("aaa111") == b"hello"
+        assert reader.read_object("bbb222") is None